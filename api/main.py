@@ -1,16 +1,48 @@
+import asyncio
+import functools
 import logging
-from fastapi import FastAPI, Path, HTTPException, Request, Depends
+import os
+import queue
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from fastapi import FastAPI, Path, HTTPException, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import JSONResponse, FileResponse
-from fastapi.exceptions import RequestValidationError, ResponseValidationError
-from typing import Annotated, List, Final, Optional
+from fastapi.responses import JSONResponse, FileResponse, Response
+from fastapi.exceptions import RequestValidationError
+from typing import Annotated, Any, Callable, List, Final, Optional, TypeVar
 import sqlite3
+import orjson
+from cachetools import TTLCache
 from pydantic import BaseModel, Field
 
 DB_FILE_NAME: Final[str] = "movies-extended.db"
 MOVIE_TABLE_NAME: Final[str] = "movie"
 ACTOR_TABLE_NAME: Final[str] = "actor"
 MOVIE_ACTOR_TABLE_NAME: Final[str] = "movie_actor_through"
+READ_POOL_SIZE: Final[int] = os.cpu_count() or 4
+STATEMENT_CACHE_SIZE: Final[int] = 256
+POOL_ACQUIRE_TIMEOUT: Final[float] = 5.0
+MOVIES_CACHE_TTL: Final[int] = 60
+UI_BUILD_DIRECTORY: Final[str] = "../ui/build"
+HASHED_ASSET_CACHE_CONTROL: Final[str] = "public, max-age=31536000, immutable"
+DEFAULT_ASSET_CACHE_CONTROL: Final[str] = "no-cache"
+CONNECTION_PRAGMAS: Final[tuple] = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA busy_timeout = 5000",
+    "PRAGMA cache_size = -64000",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA optimize",
+)
+SCHEMA_INDEXES: Final[tuple] = (
+    'CREATE INDEX IF NOT EXISTS "movieactorthrough_movie_id" ON "movie_actor_through" ("movie_id")',
+    'CREATE INDEX IF NOT EXISTS "movieactorthrough_actor_id" ON "movie_actor_through" ("actor_id")',
+    'CREATE UNIQUE INDEX IF NOT EXISTS "movieactorthrough_movie_id_actor_id" '
+    'ON "movie_actor_through" ("movie_id", "actor_id")',
+)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -18,9 +50,76 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+_READ_POOL: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=READ_POOL_SIZE)
+_READ_EXECUTOR = ThreadPoolExecutor(max_workers=READ_POOL_SIZE, thread_name_prefix="sqlite-read")
+_WRITE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite-write")
+_write_connection: Optional[sqlite3.Connection] = None
+
+_MOVIES_CACHE: TTLCache = TTLCache(maxsize=1, ttl=MOVIES_CACHE_TTL)
+_BOOT_ID: Final[str] = uuid.uuid4().hex
+# Per-process write counters behind the list ETags and the movies cache. They only see writes made by this
+# process, and a 304 never consults the TTL cache, so running several uvicorn workers would let a worker keep
+# answering 304 with stale data indefinitely. The app is meant to run as a single process (see Dockerfile).
+_VERSION = {MOVIE_TABLE_NAME: 0, ACTOR_TABLE_NAME: 0}
+
+T = TypeVar("T")
+
+
+def db_connect(read_only: bool) -> sqlite3.Connection:
+    connection = sqlite3.connect(DB_FILE_NAME, check_same_thread=not read_only, isolation_level=None,
+                                 cached_statements=STATEMENT_CACHE_SIZE)
+    for pragma in CONNECTION_PRAGMAS:
+        connection.execute(pragma)
+    if read_only:
+        connection.execute("PRAGMA query_only = ON")
+    else:
+        connection.execute("PRAGMA secure_delete = OFF")
+    return connection
+
+
+def db_ensure_indexes(db: sqlite3.Connection) -> None:
+    with db_transaction(db) as cursor:
+        for statement in SCHEMA_INDEXES:
+            cursor.execute(statement)
 
-app.mount("/static", StaticFiles(directory="../ui/build/static", check_dir=False), name="static")
+
+def _open_write_connection() -> None:
+    global _write_connection
+    _write_connection = db_connect(read_only=False)
+    db_ensure_indexes(_write_connection)
+
+
+def _close_write_connection() -> None:
+    global _write_connection
+    _write_connection.close()
+    _write_connection = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(_WRITE_EXECUTOR, _open_write_connection)
+    for _ in range(READ_POOL_SIZE):
+        _READ_POOL.put(db_connect(read_only=True))
+    try:
+        yield
+    finally:
+        while not _READ_POOL.empty():
+            _READ_POOL.get().close()
+        await loop.run_in_executor(_WRITE_EXECUTOR, _close_write_connection)
+
+
+class HashedStaticFiles(StaticFiles):
+    def file_response(self, full_path: str, stat_result: os.stat_result, scope: dict,
+                      status_code: int = 200) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        response.headers["Cache-Control"] = HASHED_ASSET_CACHE_CONTROL
+        return response
+
+
+app = FastAPI(lifespan=lifespan)
+
+app.mount("/static", HashedStaticFiles(directory=f"{UI_BUILD_DIRECTORY}/static", check_dir=False), name="static")
 
 
 class MovieBase(BaseModel):
@@ -51,57 +150,123 @@ class MovieWithActors(Movie):
     actors: List[Actor] = []
 
 
-def get_db():
-    connection = sqlite3.connect(DB_FILE_NAME)
-    connection.row_factory = sqlite3.Row
-    connection.execute("PRAGMA foreign_keys = ON")
+WRITE_COLUMNS: Final[dict] = {
+    MOVIE_TABLE_NAME: tuple(MovieBase.model_fields),
+    ACTOR_TABLE_NAME: tuple(ActorBase.model_fields),
+}
+TABLE_COLUMNS: Final[dict] = {table: ("id", *columns) for table, columns in WRITE_COLUMNS.items()}
+_SELECT_SQL: Final[dict] = {
+    table: f"SELECT {', '.join(columns)} FROM {table}" for table, columns in TABLE_COLUMNS.items()
+}
+_SELECT_ONE_SQL: Final[dict] = {table: f"{query} WHERE id=?" for table, query in _SELECT_SQL.items()}
+_INSERT_SQL: Final[dict] = {
+    table: f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['?'] * len(columns))}) RETURNING id"
+    for table, columns in WRITE_COLUMNS.items()
+}
+_UPDATE_SQL: Final[dict] = {
+    table: f"UPDATE {table} SET {', '.join([f'{column}=?' for column in columns])} WHERE id=?"
+    for table, columns in WRITE_COLUMNS.items()
+}
+_SELECT_JSON_SQL: Final[dict] = {
+    table: "SELECT json_group_array(json_object("
+           + ", ".join([f"'{column}', {column}" for column in columns])
+           + f")) FROM {table}"
+    for table, columns in TABLE_COLUMNS.items()
+}
+
+
+def _run_with_connection(pool: "queue.Queue[sqlite3.Connection]", func: Callable[..., T], *args: Any,
+                         **kwargs: Any) -> T:
+    try:
+        connection = pool.get(timeout=POOL_ACQUIRE_TIMEOUT)
+    except queue.Empty:
+        raise RuntimeError("No database connection available; is the application lifespan running?") from None
     try:
-        yield connection
+        return func(connection, *args, **kwargs)
     finally:
-        connection.close()
+        pool.put(connection)
+
+
+def _run_with_write_connection(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    if _write_connection is None:
+        raise RuntimeError("Write connection is not open; is the application lifespan running?")
+    return func(_write_connection, *args, **kwargs)
+
+
+async def db_read(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    loop = asyncio.get_running_loop()
+    call = functools.partial(_run_with_connection, _READ_POOL, func, *args, **kwargs)
+    return await loop.run_in_executor(_READ_EXECUTOR, call)
+
+
+async def db_write(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    loop = asyncio.get_running_loop()
+    call = functools.partial(_run_with_write_connection, func, *args, **kwargs)
+    return await loop.run_in_executor(_WRITE_EXECUTOR, call)
+
+
+def invalidate(*tables: str) -> None:
+    for table in tables:
+        _VERSION[table] += 1
+    if MOVIE_TABLE_NAME in tables:
+        _MOVIES_CACHE.clear()
 
 
-def db_fetch_all(db: sqlite3.Connection, table: str) -> List[dict]:
+def table_etag(table: str) -> str:
+    return f'W/"{_BOOT_ID}-{_VERSION[table]}"'
+
+
+def orjson_response(content: Any, headers: Optional[dict] = None) -> Response:
+    return Response(orjson.dumps(content), media_type="application/json", headers=headers)
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    return if_none_match is not None and etag in (tag.strip() for tag in if_none_match.split(","))
+
+
+@contextmanager
+def db_transaction(db: sqlite3.Connection):
+    with db:
+        db.execute("BEGIN IMMEDIATE")
+        yield db.cursor()
+
+
+def db_fetch_all_json(db: sqlite3.Connection, table: str) -> bytes:
     cursor = db.cursor()
-    query = f"SELECT * FROM {table}"
-    cursor.execute(query)
-    return [dict(row) for row in cursor]
+    return cursor.execute(_SELECT_JSON_SQL[table]).fetchone()[0].encode()
 
 
 def db_fetch_one(db: sqlite3.Connection, table: str, item_id: int) -> Optional[dict]:
     cursor = db.cursor()
-    query = f"SELECT * FROM {table} WHERE id=?"
-    row = cursor.execute(query, (item_id,)).fetchone()
+    row = cursor.execute(_SELECT_ONE_SQL[table], (item_id,)).fetchone()
     if row:
-        return dict(row)
+        return dict(zip(TABLE_COLUMNS[table], row))
     return None
 
 
 def db_insert(db: sqlite3.Connection, table: str, data: dict) -> int:
-    columns = ", ".join(data.keys())
-    placeholders = ", ".join(["?"] * len(data))
-    query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
-    values = tuple(data.values())
-    with db:
-        cursor = db.cursor()
-        cursor.execute(query, values)
-        return cursor.lastrowid
+    return db_insert_many(db, table, [data])[0]
+
+
+def db_insert_many(db: sqlite3.Connection, table: str, rows: List[dict]) -> List[int]:
+    query = _INSERT_SQL[table]
+    columns = WRITE_COLUMNS[table]
+    with db_transaction(db) as cursor:
+        # executemany() discards RETURNING rows, so the cached statement is stepped once per row instead
+        return [cursor.execute(query, tuple(row[column] for column in columns)).fetchone()[0] for row in rows]
 
 
 def db_update(db: sqlite3.Connection, table: str, item_id: int, data: dict) -> bool:
-    set_clause = ", ".join([f"{key}=?" for key in data.keys()])
-    query = f"UPDATE {table} SET {set_clause} WHERE id=?"
-    values = list(data.values()) + [item_id]
-    with db:
-        cursor = db.cursor()
-        cursor.execute(query, values)
+    values = [data[column] for column in WRITE_COLUMNS[table]] + [item_id]
+    with db_transaction(db) as cursor:
+        cursor.execute(_UPDATE_SQL[table], values)
         return cursor.rowcount > 0
 
 
 def db_delete(db: sqlite3.Connection, table: str, item_id: int, junction_table: str = None,
               junction_column: str = None) -> bool:
-    with db:
-        cursor = db.cursor()
+    with db_transaction(db) as cursor:
         if junction_table and junction_column:
             cursor.execute(f"DELETE FROM {junction_table} WHERE {junction_column}=?", (item_id,))
         cursor.execute(f"DELETE FROM {table} WHERE id=?", (item_id,))
@@ -109,79 +274,73 @@ def db_delete(db: sqlite3.Connection, table: str, item_id: int, junction_table:
 
 
 def db_delete_all(db: sqlite3.Connection, table: str, junction_table: str = None) -> int:
-    with db:
-        cursor = db.cursor()
+    with db_transaction(db) as cursor:
         if junction_table:
             cursor.execute(f"DELETE FROM {junction_table}")
         cursor.execute(f"DELETE FROM {table}")
         return cursor.rowcount
 
 
-def db_fetch_movie_actors(db: sqlite3.Connection, movie_id: int) -> List[dict]:
+def db_fetch_movie_actors(db: sqlite3.Connection, movie_id: int) -> Optional[List[dict]]:
     cursor = db.cursor()
     query = '''
-            SELECT a.id, a.name, a.surname
-            FROM actor a
-            JOIN movie_actor_through mat ON a.id = mat.actor_id
-            WHERE mat.movie_id = ? 
+            SELECT m.id AS movie_id, a.id, a.name, a.surname
+            FROM movie m
+            LEFT JOIN movie_actor_through mat ON mat.movie_id = m.id
+            LEFT JOIN actor a ON a.id = mat.actor_id
+            WHERE m.id = ?
             '''
-    cursor.execute(query, (movie_id,))
-    return [dict(row) for row in cursor]
+    rows = cursor.execute(query, (movie_id,)).fetchall()
+    if not rows:
+        return None
+    return [{"id": actor_id, "name": name, "surname": surname}
+            for _, actor_id, name, surname in rows if actor_id is not None]
 
 
-def db_fetch_all_movies_with_actors(db: sqlite3.Connection) -> List[dict]:
+def db_fetch_all_movies_with_actors_json(db: sqlite3.Connection) -> bytes:
     cursor = db.cursor()
     query = '''
-        SELECT 
-            m.id as movie_id, m.title, m.year, m.director, m.description,
-            a.id as actor_id, a.name, a.surname
-        FROM movie m
-        LEFT JOIN movie_actor_through mat ON m.id = mat.movie_id
-        LEFT JOIN actor a ON mat.actor_id = a.id
+        SELECT json_group_array(json_object(
+            'id', id, 'title', title, 'year', year, 'director', director, 'description', description,
+            'actors', json(actors)
+        ))
+        FROM (
+            SELECT
+                m.id, m.title, m.year, m.director, m.description,
+                json_group_array(json_object('id', a.id, 'name', a.name, 'surname', a.surname))
+                    FILTER (WHERE a.id IS NOT NULL) AS actors
+            FROM movie m
+            LEFT JOIN movie_actor_through mat ON m.id = mat.movie_id
+            LEFT JOIN actor a ON mat.actor_id = a.id
+            GROUP BY m.id
+            ORDER BY m.id
+        )
     '''
-    cursor.execute(query)
-    rows = cursor.fetchall()
-
-    movies_map = {}
-
-    for row in rows:
-        m_id = row['movie_id']
-        
-        if m_id not in movies_map:
-            movies_map[m_id] = {
-                "id": m_id,
-                "title": row['title'],
-                "year": row['year'],
-                "director": row['director'],
-                "description": row['description'],
-                "actors": []
-            }
-        
-        if row['actor_id'] is not None:
-            actor = {
-                "id": row['actor_id'],
-                "name": row['name'],
-                "surname": row['surname']
-            }
-            movies_map[m_id]['actors'].append(actor)
-
-    return list(movies_map.values())
+    return cursor.execute(query).fetchone()[0].encode()
+
+
+def _link_actors(cursor: sqlite3.Cursor, movie_id: int, actor_ids: List[int]) -> int:
+    cursor.executemany(
+        "INSERT OR IGNORE INTO movie_actor_through (movie_id, actor_id) VALUES (?, ?)",
+        [(movie_id, actor_id) for actor_id in actor_ids]
+    )
+    return cursor.rowcount
+
+
+def db_link_actors(db: sqlite3.Connection, movie_id: int, actor_ids: List[int]) -> int:
+    with db_transaction(db) as cursor:
+        return _link_actors(cursor, movie_id, actor_ids)
 
 
 def db_insert_movie_with_actors(db: sqlite3.Connection, movie: MovieCreate) -> int:
-    with db:
-        cursor = db.cursor()
+    with db_transaction(db) as cursor:
 
-        sql_movie = "INSERT INTO movie (title, year, director, description) VALUES (?, ?, ?, ?)"
-        cursor.execute(sql_movie, (movie.title, movie.year, movie.director, movie.description))
-        new_movie_id = cursor.lastrowid
+        values = tuple(getattr(movie, column) for column in WRITE_COLUMNS[MOVIE_TABLE_NAME])
+        cursor.execute(_INSERT_SQL[MOVIE_TABLE_NAME], values)
+        new_movie_id = cursor.fetchone()[0]
 
         if movie.actor_ids:
-            relations = [(new_movie_id, actor_id) for actor_id in movie.actor_ids]
-            cursor.executemany(
-                f"INSERT INTO movie_actor_through (movie_id, actor_id) VALUES (?, ?)",
-                relations
-            )
+            _link_actors(cursor, new_movie_id, movie.actor_ids)
 
         return new_movie_id
 
@@ -222,15 +381,6 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     )
 
 
-@app.exception_handler(ResponseValidationError)
-async def response_validation_exception_handler(request: Request, exc: ResponseValidationError):
-    logger.exception("Response validation error")
-    return JSONResponse(
-        status_code=500,
-        content={"detail": "Internal Server Error"}
-    )
-
-
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     logger.exception("Unhandled exception occurred")
@@ -242,25 +392,35 @@ async def global_exception_handler(request: Request, exc: Exception):
 
 @app.get("/")
 def serve_react_app():
-    return FileResponse("../ui/build/index.html")
+    return FileResponse(f"{UI_BUILD_DIRECTORY}/index.html", headers={"Cache-Control": DEFAULT_ASSET_CACHE_CONTROL})
 
 
 @app.get('/movies', response_model=List[MovieWithActors])
-def get_movies(db: sqlite3.Connection = Depends(get_db)):
-    return db_fetch_all_movies_with_actors(db)
+async def get_movies(request: Request):
+    etag = table_etag(MOVIE_TABLE_NAME)
+    if is_not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    content = _MOVIES_CACHE.get(())
+    if content is None:
+        version = _VERSION[MOVIE_TABLE_NAME]
+        content = await db_read(db_fetch_all_movies_with_actors_json)
+        if version == _VERSION[MOVIE_TABLE_NAME]:
+            _MOVIES_CACHE[()] = content
+    return Response(content, media_type="application/json", headers={"ETag": etag})
 
 
 @app.get('/movies/{movie_id}', response_model=Movie)
-def get_movie(movie_id: Annotated[int, Path(gt=0)], db: sqlite3.Connection = Depends(get_db)):
-    movie = db_fetch_one(db, MOVIE_TABLE_NAME, movie_id)
+async def get_movie(movie_id: Annotated[int, Path(gt=0)]):
+    movie = await db_read(db_fetch_one, MOVIE_TABLE_NAME, movie_id)
     if movie is None:
         raise HTTPException(404, "Movie not found")
-    return movie
+    return orjson_response(movie)
 
 
 @app.post('/movies')
-def add_movie(movie: MovieCreate, db: sqlite3.Connection = Depends(get_db)):
-    new_id = db_insert_movie_with_actors(db, movie)
+async def add_movie(movie: MovieCreate):
+    new_id = await db_write(db_insert_movie_with_actors, movie)
+    invalidate(MOVIE_TABLE_NAME)
     return {
         "id": new_id,
         "message": "Movie added successfully"
@@ -268,25 +428,28 @@ def add_movie(movie: MovieCreate, db: sqlite3.Connection = Depends(get_db)):
 
 
 @app.delete('/movies/{movie_id}')
-def delete_movie(movie_id: Annotated[int, Path(gt=0)], db: sqlite3.Connection = Depends(get_db)):
-    deleted = db_delete(db, MOVIE_TABLE_NAME, movie_id, junction_table=MOVIE_ACTOR_TABLE_NAME,
-                        junction_column='movie_id')
+async def delete_movie(movie_id: Annotated[int, Path(gt=0)]):
+    deleted = await db_write(db_delete, MOVIE_TABLE_NAME, movie_id, junction_table=MOVIE_ACTOR_TABLE_NAME,
+                             junction_column='movie_id')
+    invalidate(MOVIE_TABLE_NAME)
     if not deleted:
         raise HTTPException(404, "Movie not found")
     return {"message": "Movie deleted successfully"}
 
 
 @app.put('/movies/{movie_id}')
-def update_movie(movie_id: Annotated[int, Path(gt=0)], movie: MovieBase, db: sqlite3.Connection = Depends(get_db)):
-    updated = db_update(db, MOVIE_TABLE_NAME, movie_id, movie.model_dump())
+async def update_movie(movie_id: Annotated[int, Path(gt=0)], movie: MovieBase):
+    updated = await db_write(db_update, MOVIE_TABLE_NAME, movie_id, movie.__dict__)
+    invalidate(MOVIE_TABLE_NAME)
     if not updated:
         raise HTTPException(404, "Movie not found")
     return {"message": "Movie updated successfully"}
 
 
 @app.delete('/movies')
-def delete_movies(db: sqlite3.Connection = Depends(get_db)):
-    deleted_count = db_delete_all(db, MOVIE_TABLE_NAME, junction_table=MOVIE_ACTOR_TABLE_NAME)
+async def delete_movies():
+    deleted_count = await db_write(db_delete_all, MOVIE_TABLE_NAME, junction_table=MOVIE_ACTOR_TABLE_NAME)
+    invalidate(MOVIE_TABLE_NAME)
     return {
         "deleted": deleted_count,
         "message": "Movies deleted successfully"
@@ -294,21 +457,26 @@ def delete_movies(db: sqlite3.Connection = Depends(get_db)):
 
 
 @app.get('/actors', response_model=List[Actor])
-def get_actors(db: sqlite3.Connection = Depends(get_db)):
-    return db_fetch_all(db, ACTOR_TABLE_NAME)
+async def get_actors(request: Request):
+    etag = table_etag(ACTOR_TABLE_NAME)
+    if is_not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    content = await db_read(db_fetch_all_json, ACTOR_TABLE_NAME)
+    return Response(content, media_type="application/json", headers={"ETag": etag})
 
 
 @app.get('/actors/{actor_id}', response_model=Actor)
-def get_actor(actor_id: Annotated[int, Path(gt=0)], db: sqlite3.Connection = Depends(get_db)):
-    actor = db_fetch_one(db, ACTOR_TABLE_NAME, actor_id)
+async def get_actor(actor_id: Annotated[int, Path(gt=0)]):
+    actor = await db_read(db_fetch_one, ACTOR_TABLE_NAME, actor_id)
     if actor is None:
         raise HTTPException(404, "Actor not found")
-    return actor
+    return orjson_response(actor)
 
 
 @app.post('/actors')
-def add_actor(actor: ActorBase, db: sqlite3.Connection = Depends(get_db)):
-    new_id = db_insert(db, ACTOR_TABLE_NAME, actor.model_dump())
+async def add_actor(actor: ActorBase):
+    new_id = await db_write(db_insert, ACTOR_TABLE_NAME, actor.__dict__)
+    invalidate(ACTOR_TABLE_NAME)
     return {
         "id": new_id,
         "message": "Actor added successfully"
@@ -316,25 +484,28 @@ def add_actor(actor: ActorBase, db: sqlite3.Connection = Depends(get_db)):
 
 
 @app.delete('/actors/{actor_id}')
-def delete_actor(actor_id: Annotated[int, Path(gt=0)], db: sqlite3.Connection = Depends(get_db)):
-    deleted = db_delete(db, ACTOR_TABLE_NAME, actor_id, junction_table=MOVIE_ACTOR_TABLE_NAME,
-                        junction_column='actor_id')
+async def delete_actor(actor_id: Annotated[int, Path(gt=0)]):
+    deleted = await db_write(db_delete, ACTOR_TABLE_NAME, actor_id, junction_table=MOVIE_ACTOR_TABLE_NAME,
+                             junction_column='actor_id')
+    invalidate(ACTOR_TABLE_NAME, MOVIE_TABLE_NAME)
     if not deleted:
         raise HTTPException(404, "Actor not found")
     return {"message": "Actor deleted successfully"}
 
 
 @app.put('/actors/{actor_id}')
-def update_actor(actor_id: Annotated[int, Path(gt=0)], actor: ActorBase, db: sqlite3.Connection = Depends(get_db)):
-    updated = db_update(db, ACTOR_TABLE_NAME, actor_id, actor.model_dump())
+async def update_actor(actor_id: Annotated[int, Path(gt=0)], actor: ActorBase):
+    updated = await db_write(db_update, ACTOR_TABLE_NAME, actor_id, actor.__dict__)
+    invalidate(ACTOR_TABLE_NAME, MOVIE_TABLE_NAME)
     if not updated:
         raise HTTPException(404, "Actor not found")
     return {"message": "Actor updated successfully"}
 
 
 @app.get('/movies/{movie_id}/actors', response_model=List[Actor])
-def get_movie_actors(movie_id: Annotated[int, Path(gt=0)], db: sqlite3.Connection = Depends(get_db)):
-    movie = db_fetch_one(db, MOVIE_TABLE_NAME, movie_id)
-    if movie is None:
+async def get_movie_actors(movie_id: Annotated[int, Path(gt=0)]):
+    actors = await db_read(db_fetch_movie_actors, movie_id)
+    if actors is None:
         raise HTTPException(404, "Movie not found")
-    return db_fetch_movie_actors(db, movie_id)
+    return orjson_response(actors)
+